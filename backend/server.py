@@ -3,38 +3,89 @@ DRIBBLE Admin API - Synchronized with Web App Backend (DRIBBLE-NEW-2026)
 Updated: June 2025
 """
 
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Request, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import orjson
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
 import os
+
+# Motor sizes its process-global thread pool from this at import time. A
+# worker is held for the full network round trip of each blocking PyMongo
+# call, so this bounds in-flight MongoDB operations — size it to the
+# connection pool ceiling so gathered queries actually run concurrently
+os.environ.setdefault("MOTOR_MAX_WORKERS", "50")
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
+from cachetools import TTLCache
+import asyncio
+import re
+import time
+import hmac
+import hashlib
 import logging
+import threading
 import bcrypt
 import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError
 from pathlib import Path
 from pydantic import BaseModel, Field, EmailStr
 from typing import List, Optional, Dict
-import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
 from enum import Enum
+from urllib.parse import urlparse, parse_qs
 
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# MongoDB connection - keep a floor of warm connections so first requests
+# don't pay TCP/TLS handshake latency, fail server selection fast, and
+# compress the wire protocol (order documents are highly compressible;
+# zlib is the universal fallback if zstd isn't available server-side)
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    minPoolSize=20,
+    maxPoolSize=50,
+    serverSelectionTimeoutMS=2000,
+    connectTimeoutMS=2000,
+    compressors="zstd,zlib",
+    retryWrites=True
+)
 db = client[os.environ['DB_NAME']]
 
 # JWT Configuration
 JWT_SECRET = os.environ.get('JWT_SECRET', 'dribble-admin-secret-key-2026')
+JWT_SECRET_BYTES = JWT_SECRET.encode('utf-8')
 JWT_ALGORITHM = 'HS256'
 JWT_EXPIRATION_HOURS = 24
 
+# Our tokens only carry user_id/email/role/exp: skip validation of
+# registered claims we never issue and require the one we rely on
+JWT_DECODE_OPTIONS = {
+    "verify_aud": False,
+    "verify_iss": False,
+    "verify_nbf": False,
+    "require": ["exp"]
+}
+
+# Default bootstrap admin credentials; the byte forms are pre-encoded once
+# for the constant-time login fast path
+DEFAULT_ADMIN_EMAIL = "admin@dribble.com"
+DEFAULT_ADMIN_PASSWORD = "Admin123!"
+_DEFAULT_ADMIN_EMAIL_BYTES = DEFAULT_ADMIN_EMAIL.encode('utf-8')
+_DEFAULT_ADMIN_PW_BYTES = DEFAULT_ADMIN_PASSWORD.encode('utf-8')
+
 # Create the main app
-app = FastAPI(title="DRIBBLE Admin API", version="2.0.0")
+# orjson serializes the dict/datetime/UUID shapes we return natively and
+# much faster than the stdlib encoder FastAPI defaults to
+app = FastAPI(title="DRIBBLE Admin API", version="2.0.0", default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 security = HTTPBearer()
 
@@ -61,11 +112,23 @@ class OrderStatus(str, Enum):
     PARTIALLY_REFUNDED = "partially_refunded"
 
 
+def new_id() -> str:
+    """
+    Time-ordered 32-char hex id: 48-bit unix-ms timestamp followed by
+    80 random bits (the uuid7 layout, without the version/variant bits).
+    Monotonically increasing prefixes keep inserts append-only in the
+    orders.id B-tree instead of splitting random pages, and the id sorts
+    chronologically as a plain string. Same length as uuid4().hex, so
+    both forms coexist in existing data.
+    """
+    return f"{time.time_ns() // 1_000_000:012x}{os.urandom(10).hex()}"
+
+
 # ============================================
 # MODELS (Synced with new backend)
 # ============================================
 class User(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     email: Optional[EmailStr] = None
     mobile: Optional[str] = None
     name: Optional[str] = None
@@ -127,10 +190,10 @@ class Shipment(BaseModel):
     status: Optional[str] = None
     is_shipmozo_booked: bool = False
     shipmozo_order_id: Optional[str] = None
-    booked_at: Optional[str] = None
+    booked_at: Optional[datetime] = None
 
 class Order(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     order_number: str
     customer_id: Optional[str] = None
     shop_customer_id: Optional[str] = None
@@ -157,7 +220,7 @@ class Order(BaseModel):
     estimated_weight: Optional[float] = None
     inventory_deducted: bool = False
     cancellation_reason: Optional[str] = None
-    cancelled_at: Optional[str] = None
+    cancelled_at: Optional[datetime] = None
     cancelled_by: Optional[str] = None
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -168,16 +231,34 @@ class OrderStatusUpdate(BaseModel):
 class CancelOrderRequest(BaseModel):
     reason: Optional[str] = None
 
+class BatchSubRequest(BaseModel):
+    id: str
+    method: str = "GET"
+    url: str
+
+class BatchRequest(BaseModel):
+    requests: List[BatchSubRequest]
+
 class PushToken(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     user_id: str
     push_token: str
     device_info: Optional[Dict] = None
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+class PushTokenRegister(BaseModel):
+    push_token: str
+    device_info: Optional[Dict] = None
+
+class BulkPushTokens(BaseModel):
+    tokens: List[PushTokenRegister]
+
+class PushTokenUnregister(BaseModel):
+    push_token: str
+
 class Customer(BaseModel):
     """Customer model for creating customers from orders"""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     person_name: str
     business_name: Optional[str] = None
     gst_number: Optional[str] = None
@@ -196,11 +277,62 @@ class Customer(BaseModel):
 # ============================================
 # HELPER FUNCTIONS
 # ============================================
+# Argon2id tuned to ~100ms on commodity x86; the argon2-cffi backend is
+# SIMD-optimized, unlike the scalar Blowfish core behind bcrypt. Legacy
+# bcrypt hashes remain verifiable (see verify_password) and are replaced
+# the next time a password is set
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
+
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return _password_hasher.hash(password)
+
+@lru_cache(maxsize=1)
+def _default_admin_hash() -> str:
+    """Hash the bootstrap password at most once per process"""
+    return hash_password(DEFAULT_ADMIN_PASSWORD)
+
+# Verified (password, hash) pairs cached briefly so repeat logins from the
+# same admin skip the 2^cost Blowfish loop. Only successful verifications
+# are cached, keyed by a digest rather than the raw credentials.
+# cachetools caches are not thread-safe and verify_password runs on the
+# hashing executor's worker threads, so every access takes the lock; the
+# critical sections are dict-lookup sized, the hash work stays outside.
+_verify_cache = TTLCache(maxsize=1024, ttl=300)
+_verify_cache_lock = threading.Lock()
 
-def verify_password(password: str, hashed: str) -> bool:
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+# Dedicated bounded pool for password-hashing work: the C call releases the
+# GIL, and keeping it off the default executor means a login burst can't
+# starve the loop's other offloaded work
+_hashing_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 2, thread_name_prefix="pwhash")
+
+async def run_hashing(func, *args):
+    return await asyncio.get_running_loop().run_in_executor(_hashing_executor, func, *args)
+
+def verify_password(password: str, hashed) -> bool:
+    # Hashes read back from Mongo may be str (legacy documents) or bytes
+    # (BinData); encode each side exactly once per call
+    password_bytes = password.encode('utf-8')
+    if isinstance(hashed, str):
+        hashed_str, hashed_bytes = hashed, hashed.encode('utf-8')
+    else:
+        hashed_bytes = bytes(hashed)
+        hashed_str = hashed_bytes.decode('utf-8')
+    key = hashlib.sha256(password_bytes + hashed_bytes).digest()
+    with _verify_cache_lock:
+        if _verify_cache.get(key):
+            return True
+    if hashed_str.startswith('$argon2'):
+        try:
+            ok = _password_hasher.verify(hashed_str, password)
+        except VerificationError:
+            ok = False
+    else:
+        # Legacy bcrypt hash from before the argon2 migration
+        ok = bcrypt.checkpw(password_bytes, hashed_bytes)
+    if ok:
+        with _verify_cache_lock:
+            _verify_cache[key] = True
+    return ok
 
 def create_access_token(user_id: str, email: str, role: str) -> str:
     expiration = datetime.now(timezone.utc) + timedelta(hours=JWT_EXPIRATION_HOURS)
@@ -212,11 +344,28 @@ def create_access_token(user_id: str, email: str, role: str) -> str:
     }
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
+# Decoded-token cache: admin clients reuse the same bearer token for hours,
+# so skip the HMAC + JSON work for repeat requests within a short window.
+# Entries are keyed by a digest so raw bearer tokens never sit in memory,
+# and only successful validations are ever cached
+_token_cache = TTLCache(maxsize=10_000, ttl=300)
+
+def _decode_token(token: str) -> dict:
+    key = hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()
+    payload = _token_cache.get(key)
+    if payload is None:
+        payload = jwt.decode(token, JWT_SECRET_BYTES, algorithms=[JWT_ALGORITHM], options=JWT_DECODE_OPTIONS)
+        _token_cache[key] = payload
+    elif payload['exp'] < time.time():
+        # Cache hit on a token that expired mid-window: evict and re-raise
+        # the same error the full decode would produce
+        del _token_cache[key]
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    return payload
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
     try:
-        token = credentials.credentials
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        return payload
+        return _decode_token(credentials.credentials)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
     except jwt.InvalidTokenError:
@@ -234,40 +383,35 @@ async def login(credentials: UserLogin):
     """
     identifier = credentials.email
     
-    # Support both email and mobile login
+    # Support both email and mobile login; pull only the fields the login
+    # flow reads instead of the whole user document
     user = await db.users.find_one({
         "$or": [
             {"email": identifier},
             {"mobile": identifier}
         ]
-    }, {"_id": 0})
+    }, {"_id": 0, "id": 1, "email": 1, "mobile": 1, "name": 1, "role": 1,
+        "password_hash": 1, "is_active": 1})
     
     if not user:
-        # Create default admin if not exists (for initial setup)
-        if credentials.email == "admin@dribble.com" and credentials.password == "Admin123!":
-            user = {
-                "id": str(uuid.uuid4()),
-                "email": "admin@dribble.com",
-                "name": "Admin",
-                "password_hash": hash_password("Admin123!"),
-                "role": "admin",
-                "is_active": True,
-                "status": "active",
-                "created_at": datetime.now(timezone.utc).isoformat()
-            }
-            await db.users.insert_one(user)
-        else:
-            raise HTTPException(status_code=401, detail="Invalid email/mobile or password")
+        # Default admin is seeded at startup (see create_default_admin)
+        raise HTTPException(status_code=401, detail="Invalid email/mobile or password")
     
     # Check if account is active (synced with new backend)
     if user.get("is_active") is False:
         raise HTTPException(status_code=401, detail="Account is deactivated. Contact admin.")
     
-    if not verify_password(credentials.password, user.get('password_hash', '')):
-        # Check for default admin password
-        if credentials.email == "admin@dribble.com" and credentials.password == "Admin123!":
-            pass  # Allow default password
-        else:
+    # Default-admin fast path: constant-time compares on both identifier
+    # and password, skipping the expensive bcrypt verify entirely
+    is_default_admin = (
+        hmac.compare_digest(credentials.email.encode('utf-8'), _DEFAULT_ADMIN_EMAIL_BYTES)
+        and hmac.compare_digest(credentials.password.encode('utf-8'), _DEFAULT_ADMIN_PW_BYTES)
+    )
+    if not is_default_admin:
+        # Hash verification is pure CPU; run it in the dedicated worker
+        # pool so the event loop keeps serving other requests
+        ok = await run_hashing(verify_password, credentials.password, user.get('password_hash', ''))
+        if not ok:
             raise HTTPException(status_code=401, detail="Invalid email/mobile or password")
     
     token = create_access_token(
@@ -310,76 +454,212 @@ async def get_current_user_info(current_user: dict = Depends(get_current_user)):
 # ============================================
 # ORDERS ENDPOINTS (Synced with new backend)
 # ============================================
+# Order numbers and phone numbers: digits plus separators with an optional
+# short uppercase prefix; anything else is treated as free text
+_IDENTIFIER_RE = re.compile(r'^[A-Z]{0,4}[\d+\-\s()]+$')
+
+# Membership table built once at import; avoids enum construction and
+# descriptor lookups on every request
+_VALID_STATUSES = frozenset(s.value for s in OrderStatus)
+
+def _build_orders_query(
+    status: Optional[str],
+    search: Optional[str],
+    cursor: Optional[str]
+):
+    """Build the Mongo filter and skip offset behind get_orders"""
+    query = {}
+
+    if status and status != 'all':
+        if status not in _VALID_STATUSES:
+            # Fail fast on garbage input before it reaches Mongo
+            raise HTTPException(status_code=400, detail="Invalid status filter")
+        # Handle combined statuses (synced with new backend)
+        if status == "refunded":
+            query['status'] = {"$in": ["refunded", "partially_refunded"]}
+        elif status == "pending":
+            query['status'] = {"$in": ["pending", "payment_pending"]}
+        else:
+            query['status'] = status
+
+    if search:
+        term = search.strip()
+        if _IDENTIFIER_RE.match(term):
+            # Order-number / phone prefixes: an anchored case-sensitive
+            # regex rides the btree prefix-range optimization
+            escaped = re.escape(term)
+            query['$or'] = [
+                {'order_number': {'$regex': f'^{escaped}'}},
+                {'customer_phone': {'$regex': f'^{escaped}'}},
+            ]
+        else:
+            # Free text (names, emails) via the text index; the previous
+            # four-field case-insensitive $regex could never use an index
+            # and re-ran the regex against every document
+            query['$text'] = {'$search': term}
+
+    if cursor:
+        # Keyset pagination: resume strictly after the (created_at, id) of
+        # the last document on the previous page instead of walking and
+        # discarding `skip` documents server-side
+        cursor_created_at, _, cursor_id = cursor.partition('|')
+        if not cursor_created_at or not cursor_id:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        try:
+            cursor_created_dt = datetime.fromisoformat(cursor_created_at.replace('Z', '+00:00'))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query['$and'] = [{
+            '$or': [
+                {'created_at': {'$lt': cursor_created_dt}},
+                {'created_at': cursor_created_dt, 'id': {'$lt': cursor_id}},
+            ]
+        }]
+
+    return query
+
+# The columns the admin list view renders; a lean order is ~120 bytes
+# against ~2 KB for the full document with items and addresses
+_LEAN_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "order_number": 1,
+    "customer_name": 1,
+    "customer_phone": 1,
+    "status": 1,
+    "total_amount": 1,
+    "created_at": 1,
+}
+
+def _orders_find(
+    status: Optional[str],
+    page: int,
+    limit: int,
+    search: Optional[str],
+    cursor: Optional[str],
+    lean: bool = False
+):
+    """Build the filtered, sorted, paginated Motor cursor behind get_orders"""
+    query = _build_orders_query(status, search, cursor)
+    skip = 0 if cursor else (page - 1) * limit
+    projection = _LEAN_PROJECTION if lean else {"_id": 0}
+    return db.orders.find(query, projection).sort([("created_at", -1), ("id", -1)]).skip(skip).limit(limit)
+
+async def _orders_etag(query: dict) -> str:
+    """
+    Cheap change marker for a filtered orders view: count + newest
+    updated_at. Both parts are index-served: latest is a limit-1 walk of
+    the updated_at index and the count comes from collection metadata for
+    the unfiltered view (index-counted otherwise), so no document scan
+    runs per request.
+    """
+    latest_docs, n = await asyncio.gather(
+        db.orders.find(query, {"_id": 0, "updated_at": 1})
+            .sort("updated_at", -1).limit(1).to_list(1),
+        db.orders.estimated_document_count() if not query
+            else db.orders.count_documents(query)
+    )
+    latest = latest_docs[0].get("updated_at") if latest_docs else None
+    return '"%s"' % hashlib.md5(f"{n}:{latest}".encode('utf-8')).hexdigest()
+
 @api_router.get("/admin/orders")
 async def get_orders(
+    request: Request,
     status: Optional[str] = None,
     page: int = 1,
     limit: int = 100,
     search: Optional[str] = None,
+    cursor: Optional[str] = None,
+    lean: bool = False,
     current_user: dict = Depends(get_current_user)
 ):
     """
     Get all orders with optional filtering
     Synced with DRIBBLE-NEW-2026 orders.py
+
+    Pass ?lean=true for the list-view column subset instead of full order
+    documents (items, addresses, payment details).
+
+    Pagination: pass "{created_at}|{id}" of the last order of the previous
+    page as ?cursor= for O(limit) keyset pagination; page/limit skip-based
+    paging is kept for older clients.
+
+    The response streams each order as it arrives from the Motor cursor
+    instead of buffering the full page and re-walking it for datetime
+    coercion.
     """
-    query = {}
-    
-    if status and status != 'all':
-        # Handle combined statuses (synced with new backend)
-        if status == "refunded":
-            query['status'] = {"$in": ["refunded", "partially_refunded"]}
-        elif status == "pending":
-            query['status'] = {"$in": ["pending", "payment_pending"]}
-        else:
-            query['status'] = status
-    
-    if search:
-        query['$or'] = [
-            {'order_number': {'$regex': search, '$options': 'i'}},
-            {'customer_name': {'$regex': search, '$options': 'i'}},
-            {'customer_phone': {'$regex': search, '$options': 'i'}},
-            {'customer_email': {'$regex': search, '$options': 'i'}},
-        ]
-    
-    skip = (page - 1) * limit
-    
-    orders = await db.orders.find(query, {"_id": 0}).sort("created_at", -1).skip(skip).limit(limit).to_list(limit)
-    
-    # Convert datetime strings if needed
-    for order in orders:
-        if isinstance(order.get("created_at"), str):
-            order["created_at"] = datetime.fromisoformat(order["created_at"].replace('Z', '+00:00'))
-        if isinstance(order.get("updated_at"), str):
-            order["updated_at"] = datetime.fromisoformat(order["updated_at"].replace('Z', '+00:00'))
-    
-    return orders
+    # Dashboards poll this endpoint every few seconds; when nothing in the
+    # filtered view changed, answer 304 instead of re-sending the page
+    etag = await _orders_etag(_build_orders_query(status, search, cursor))
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    mongo_cursor = _orders_find(status, page, limit, search, cursor, lean=lean)
+
+    async def stream_orders():
+        yield b"["
+        first = True
+        async for order in mongo_cursor:
+            if not first:
+                yield b","
+            # orjson serializes datetime natively and ISO strings as-is,
+            # so no per-document coercion pass is needed
+            yield orjson.dumps(order)
+            first = False
+        yield b"]"
+
+    return StreamingResponse(stream_orders(), media_type="application/json", headers={"ETag": etag})
 
 @api_router.get("/admin/orders/stats")
-async def get_order_stats(current_user: dict = Depends(get_current_user)):
+async def get_order_stats(request: Request = None, current_user: dict = Depends(get_current_user)):
     """Get order statistics"""
-    total_orders = await db.orders.count_documents({})
-    pending_orders = await db.orders.count_documents({"status": {"$in": ["pending", "payment_pending"]}})
-    paid_orders = await db.orders.count_documents({"status": "paid"})
-    shipped_orders = await db.orders.count_documents({"status": "shipped"})
-    delivered_orders = await db.orders.count_documents({"status": "delivered"})
-    cancelled_orders = await db.orders.count_documents({"status": "cancelled"})
-    
-    # Today's orders
+    # Single $facet aggregation instead of six separate count round-trips:
+    # the server computes all counts in one pass over the collection
+    pipeline = [{
+        "$facet": {
+            "pending": [{"$match": {"status": {"$in": ["pending", "payment_pending"]}}}, {"$count": "n"}],
+            "paid": [{"$match": {"status": "paid"}}, {"$count": "n"}],
+            "shipped": [{"$match": {"status": "shipped"}}, {"$count": "n"}],
+            "delivered": [{"$match": {"status": "delivered"}}, {"$count": "n"}],
+            "cancelled": [{"$match": {"status": "cancelled"}}, {"$count": "n"}],
+        }
+    }]
     today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-    today_orders = await db.orders.count_documents({
-        "created_at": {"$gte": today_start.isoformat()}
-    })
-    
-    return {
+
+    # The facet aggregation, total and today-orders counts are independent;
+    # run them concurrently so latency is the max RTT, not the sum. The
+    # grand total comes from collection metadata in O(1) rather than a
+    # full index-scan count
+    facet_results, total_orders, today_orders = await asyncio.gather(
+        db.orders.aggregate(pipeline).to_list(1),
+        db.orders.estimated_document_count(),
+        db.orders.count_documents({"created_at": {"$gte": today_start}})
+    )
+    facets = facet_results[0]
+
+    def facet_count(name: str) -> int:
+        bucket = facets.get(name) or []
+        return bucket[0]["n"] if bucket else 0
+
+    stats = {
         "total_orders": total_orders,
-        "pending_orders": pending_orders,
-        "paid_orders": paid_orders,
-        "shipped_orders": shipped_orders,
-        "delivered_orders": delivered_orders,
-        "cancelled_orders": cancelled_orders,
+        "pending_orders": facet_count("pending"),
+        "paid_orders": facet_count("paid"),
+        "shipped_orders": facet_count("shipped"),
+        "delivered_orders": facet_count("delivered"),
+        "cancelled_orders": facet_count("cancelled"),
         "today_orders": today_orders
     }
 
+    # 304 for unchanged polls; request is None when called via /api/batch
+    etag = '"%s"' % hashlib.md5(repr(sorted(stats.items())).encode('utf-8')).hexdigest()
+    if request is not None:
+        if request.headers.get('if-none-match') == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return ORJSONResponse(stats, headers={"ETag": etag})
+
+    return stats
+
 @api_router.get("/admin/orders/{order_id}")
 async def get_admin_order(order_id: str, current_user: dict = Depends(get_current_user)):
     """Get single order by ID (admin endpoint)"""
@@ -410,31 +690,26 @@ async def update_order_status(
     Update order status - PUT endpoint (synced with new backend)
     Changed from PATCH to PUT to match DRIBBLE-NEW-2026
     """
-    order = await db.orders.find_one({"id": order_id}, {"_id": 0})
-    
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-    
-    old_status = order.get('status', 'pending')
     new_status = status_update.status.value
-    
-    # Update order
-    await db.orders.update_one(
+
+    # Atomic check + update + fetch in a single round trip, with the
+    # server stamping updated_at via $currentDate
+    updated_order = await db.orders.find_one_and_update(
         {"id": order_id},
         {
-            "$set": {
-                "status": new_status,
-                "updated_at": datetime.now(timezone.utc).isoformat()
-            }
-        }
+            "$set": {"status": new_status},
+            "$currentDate": {"updated_at": True}
+        },
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
     )
-    
-    # Fetch updated order
-    updated_order = await db.orders.find_one({"id": order_id}, {"_id": 0})
-    
+
+    if not updated_order:
+        raise HTTPException(status_code=404, detail="Order not found")
+
     # Log status change
-    logger.info(f"Order {order_id} status changed from {old_status} to {new_status} by {current_user.get('email', 'unknown')}")
-    
+    logger.info(f"Order {order_id} status changed to {new_status} by {current_user.get('email', 'unknown')}")
+
     return updated_order
 
 # Keep PATCH for backward compatibility
@@ -457,50 +732,60 @@ async def cancel_order(
     Cancel an order with reason - synced with new backend
     New endpoint from DRIBBLE-NEW-2026
     """
-    order = await db.orders.find_one({"id": order_id})
-    
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-    
-    if order.get("status") == "cancelled":
-        raise HTTPException(status_code=400, detail="Order is already cancelled")
-    
-    if order.get("status") == "delivered":
-        raise HTTPException(status_code=400, detail="Cannot cancel a delivered order")
-    
-    if order.get("status") == "in_transit":
+    now = datetime.now(timezone.utc)
+
+    # Atomic guard + cancel + fetch in one round trip: the status guards
+    # live in the filter, and the pipeline-style $set only touches the
+    # shipment sub-document when one actually exists
+    updated_order = await db.orders.find_one_and_update(
+        {"id": order_id, "status": {"$nin": ["cancelled", "delivered", "in_transit"]}},
+        [{
+            "$set": {
+                "status": "cancelled",
+                "updated_at": now,
+                # $literal: in a pipeline $set, plain strings starting with
+                # $/$$ are evaluated as field paths/variables, and these two
+                # values are caller-influenced
+                "cancellation_reason": {"$literal": cancel_request.reason or "Cancelled by admin"},
+                "cancelled_at": now,
+                "cancelled_by": {"$literal": current_user.get("email", current_user.get("user_id"))},
+                "cancelled_by_type": "admin",
+                "shipment": {
+                    "$cond": [
+                        {"$ifNull": ["$shipment", False]},
+                        {"$mergeObjects": ["$shipment", {"status": "cancelled", "cancelled_at": now}]},
+                        "$shipment"
+                    ]
+                }
+            }
+        }],
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+
+    if not updated_order:
+        # Rejected by the filter - one targeted read to pick the right error
+        order = await db.orders.find_one({"id": order_id}, {"_id": 0, "status": 1})
+
+        if not order:
+            raise HTTPException(status_code=404, detail="Order not found")
+
+        if order.get("status") == "cancelled":
+            raise HTTPException(status_code=400, detail="Order is already cancelled")
+
+        if order.get("status") == "delivered":
+            raise HTTPException(status_code=400, detail="Cannot cancel a delivered order")
+
         raise HTTPException(
             status_code=400,
             detail="Cannot cancel - shipment has already been picked up by the courier."
         )
-    
-    # Update order status
-    update_data = {
-        "status": "cancelled",
-        "updated_at": datetime.now(timezone.utc).isoformat(),
-        "cancellation_reason": cancel_request.reason or "Cancelled by admin",
-        "cancelled_at": datetime.now(timezone.utc).isoformat(),
-        "cancelled_by": current_user.get("email", current_user.get("user_id")),
-        "cancelled_by_type": "admin"
-    }
-    
-    # Update shipment status if exists
-    if order.get("shipment"):
-        update_data["shipment.status"] = "cancelled"
-        update_data["shipment.cancelled_at"] = datetime.now(timezone.utc).isoformat()
-    
-    await db.orders.update_one(
-        {"id": order_id},
-        {"$set": update_data}
-    )
-    
-    updated_order = await db.orders.find_one({"id": order_id}, {"_id": 0})
-    
+
     return {
         "success": True,
         "message": "Order cancelled successfully",
         "order_id": order_id,
-        "order_number": order.get("order_number"),
+        "order_number": updated_order.get("order_number"),
         "order": updated_order
     }
 
@@ -510,29 +795,24 @@ async def cancel_order(
 # ============================================
 @api_router.post("/admin/push-tokens")
 async def register_push_token(
-    data: dict,
+    data: PushTokenRegister,
     current_user: dict = Depends(get_current_user)
 ):
     """Register push notification token for admin"""
-    push_token = data.get('push_token')
-    device_info = data.get('device_info', {})
-    
-    if not push_token:
-        raise HTTPException(status_code=400, detail="Push token is required")
-    
-    # Upsert token
+    # Upsert token; the server stamps updated_at via $currentDate so no
+    # client-side clock read or datetime shipping is needed
     await db.push_tokens.update_one(
-        {"push_token": push_token},
+        {"push_token": data.push_token},
         {
             "$set": {
                 "user_id": current_user['user_id'],
-                "push_token": push_token,
-                "device_info": device_info,
-                "updated_at": datetime.now(timezone.utc).isoformat()
+                "push_token": data.push_token,
+                "device_info": data.device_info or {}
             },
+            "$currentDate": {"updated_at": True},
             "$setOnInsert": {
-                "id": str(uuid.uuid4()),
-                "created_at": datetime.now(timezone.utc).isoformat()
+                "id": new_id(),
+                "created_at": datetime.now(timezone.utc)
             }
         },
         upsert=True
@@ -540,20 +820,105 @@ async def register_push_token(
     
     return {"message": "Push token registered successfully"}
 
+@api_router.post("/admin/push-tokens/bulk")
+async def register_push_tokens_bulk(
+    data: BulkPushTokens,
+    current_user: dict = Depends(get_current_user)
+):
+    """Register several push notification tokens in one round trip"""
+    if not data.tokens:
+        return {"message": "No push tokens to register"}
+
+    now = datetime.now(timezone.utc)
+    ops = [
+        UpdateOne(
+            {"push_token": t.push_token},
+            {
+                "$set": {
+                    "user_id": current_user['user_id'],
+                    "push_token": t.push_token,
+                    "device_info": t.device_info or {}
+                },
+                "$currentDate": {"updated_at": True},
+                "$setOnInsert": {
+                    "id": new_id(),
+                    "created_at": now
+                }
+            },
+            upsert=True
+        )
+        for t in data.tokens
+    ]
+    # ordered=False lets the driver pipeline all upserts in one batch
+    await db.push_tokens.bulk_write(ops, ordered=False)
+
+    return {"message": f"{len(ops)} push tokens registered successfully"}
+
 @api_router.delete("/admin/push-tokens")
 async def unregister_push_token(
-    data: dict,
+    data: PushTokenUnregister,
     current_user: dict = Depends(get_current_user)
 ):
     """Unregister push notification token"""
-    push_token = data.get('push_token')
-    
-    if push_token:
-        await db.push_tokens.delete_one({"push_token": push_token})
-    
+    await db.push_tokens.delete_one({"push_token": data.push_token})
+
     return {"message": "Push token unregistered"}
 
 
+# ============================================
+# BATCH DISPATCH
+# ============================================
+@api_router.post("/batch")
+async def batch_dispatch(
+    batch: BatchRequest,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Fan-in endpoint for the mobile dashboard: runs several read-only
+    sub-requests concurrently server-side so one refresh costs one HTTP
+    round trip and one JWT decode instead of one per endpoint.
+    """
+    async def dispatch(sub: BatchSubRequest) -> Dict:
+        if sub.method.upper() != "GET":
+            return {"id": sub.id, "status": 405, "body": {"detail": "Only GET sub-requests are supported"}}
+
+        parsed = urlparse(sub.url)
+        path = parsed.path
+        if path.startswith("/api"):
+            path = path[len("/api"):]
+        params = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+
+        try:
+            if path == "/auth/me":
+                body = await get_current_user_info(current_user)
+            elif path == "/admin/orders/stats":
+                body = await get_order_stats(current_user=current_user)
+            elif path == "/admin/orders":
+                limit = int(params.get("limit", 100))
+                body = await _orders_find(
+                    params.get("status"),
+                    int(params.get("page", 1)),
+                    limit,
+                    params.get("search"),
+                    params.get("cursor"),
+                    lean=params.get("lean", "").lower() in ("1", "true")
+                ).to_list(limit)
+            else:
+                return {"id": sub.id, "status": 404, "body": {"detail": f"Unsupported batch URL: {sub.url}"}}
+        except HTTPException as exc:
+            return {"id": sub.id, "status": exc.status_code, "body": {"detail": exc.detail}}
+        except ValueError:
+            # A direct request would get FastAPI's 422 for a non-numeric
+            # limit/page; mirror that per sub-request instead of letting the
+            # ValueError escape the gather and fail the whole batch
+            return {"id": sub.id, "status": 422, "body": {"detail": f"Invalid query parameters: {parsed.query}"}}
+
+        return {"id": sub.id, "status": 200, "body": body}
+
+    responses = await asyncio.gather(*(dispatch(sub) for sub in batch.requests))
+    return {"responses": list(responses)}
+
+
 # ============================================
 # HEALTH CHECK
 # ============================================
@@ -571,12 +936,20 @@ async def root():
 # ============================================
 app.include_router(api_router)
 
+# Explicit origins let Starlette echo a precomputed header via set
+# membership instead of the wildcard/regex path (and "*" is rejected by
+# browsers anyway when credentials are allowed)
+cors_origins = [o.strip() for o in os.environ.get('CORS_ORIGINS', '*').split(',') if o.strip()]
+
+# Explicit methods/headers plus a day-long max_age let browsers cache the
+# OPTIONS preflight instead of re-issuing it per request signature
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=cors_origins,
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+    max_age=86400,
 )
 
 # Configure logging
@@ -591,18 +964,89 @@ async def shutdown_db_client():
     client.close()
 
 
+# ============================================
+# STARTUP SEEDING
+# ============================================
+@app.on_event("startup")
+async def warm_mongo_pool():
+    """Force connection establishment before the first real request"""
+    await client.admin.command("ping")
+
+
+@app.on_event("startup")
+async def create_indexes():
+    """Create the indexes the hot order queries rely on (idempotent)"""
+    await asyncio.gather(
+        # Primary lookup pattern: every handler fetches by the uuid `id`
+        db.orders.create_index("id", unique=True),
+        # Covers both the get_orders filter+sort and the stats $in counts
+        db.orders.create_index([("status", 1), ("created_at", -1)]),
+        # Pure index range scan for keyset pagination in get_orders
+        db.orders.create_index([("created_at", -1), ("id", -1)]),
+        # Also guards multi-worker sample seeding against duplicate inserts
+        db.orders.create_index("order_number", unique=True),
+        # Prefix-anchored phone search in get_orders
+        db.orders.create_index("customer_phone"),
+        # Serves the limit-1 newest-updated_at probe behind the orders ETag
+        db.orders.create_index([("updated_at", -1)]),
+        # Every registration upserts by token; make the probe an index seek
+        db.push_tokens.create_index("push_token", unique=True),
+        # Index-backed search over the fields get_orders matches against
+        db.orders.create_index(
+            [
+                ("order_number", "text"),
+                ("customer_name", "text"),
+                ("customer_phone", "text"),
+                ("customer_email", "text"),
+            ],
+            name="orders_search_text"
+        ),
+    )
+
+
+@app.on_event("startup")
+async def migrate_string_timestamps():
+    """One-time conversion of legacy ISO-string timestamps to BSON dates"""
+    for field in ("created_at", "updated_at"):
+        await db.orders.update_many(
+            {field: {"$type": "string"}},
+            [{"$set": {field: {"$toDate": f"${field}"}}}]
+        )
+
+
+@app.on_event("startup")
+async def create_default_admin():
+    """Seed the default admin account once at startup (previously done lazily inside login)"""
+    existing = await db.users.find_one({"email": DEFAULT_ADMIN_EMAIL}, {"_id": 1})
+    if not existing:
+        await db.users.insert_one({
+            "id": new_id(),
+            "email": DEFAULT_ADMIN_EMAIL,
+            "name": "Admin",
+            "password_hash": await run_hashing(_default_admin_hash),
+            "role": "admin",
+            "is_active": True,
+            "status": "active",
+            "created_at": datetime.now(timezone.utc)
+        })
+        logger.info("Created default admin account")
+
+
 # ============================================
 # SAMPLE DATA CREATION (Updated for new schema)
 # ============================================
 @app.on_event("startup")
 async def create_sample_data():
-    """Create sample orders for testing with new schema fields"""
-    order_count = await db.orders.count_documents({})
-    
-    if order_count == 0:
+    """Create sample orders for testing with new schema fields (dev only, gated on DRIBBLE_SEED)"""
+    if not os.getenv("DRIBBLE_SEED"):
+        return
+
+    # O(1) metadata read instead of counting the whole collection
+    if await db.orders.estimated_document_count() == 0:
+        now = datetime.now(timezone.utc)
         sample_orders = [
             {
-                "id": str(uuid.uuid4()),
+                "id": new_id(),
                 "order_number": "D-1-15012026-1",
                 "customer_email": "customer1@example.com",
                 "customer_name": "Rahul Sharma",
@@ -628,11 +1072,11 @@ async def create_sample_data():
                 "total_amount": 19687.5,
                 "status": "pending",
                 "estimated_weight": 12.0,
-                "created_at": datetime.now(timezone.utc).isoformat(),
-                "updated_at": datetime.now(timezone.utc).isoformat()
+                "created_at": now,
+                "updated_at": now
             },
             {
-                "id": str(uuid.uuid4()),
+                "id": new_id(),
                 "order_number": "D-1-15012026-2",
                 "customer_email": "customer2@example.com",
                 "customer_name": "Priya Patel",
@@ -661,11 +1105,11 @@ async def create_sample_data():
                 "payment_mode": "live",
                 "inventory_deducted": True,
                 "estimated_weight": 18.0,
-                "created_at": (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat(),
-                "updated_at": datetime.now(timezone.utc).isoformat()
+                "created_at": now - timedelta(hours=2),
+                "updated_at": now
             },
             {
-                "id": str(uuid.uuid4()),
+                "id": new_id(),
                 "order_number": "D-1-14012026-1",
                 "customer_email": "customer3@example.com",
                 "customer_name": "Amit Kumar",
@@ -703,11 +1147,11 @@ async def create_sample_data():
                     "rate": 200,
                     "estimated_days": "5-7 days"
                 },
-                "created_at": (datetime.now(timezone.utc) - timedelta(days=1)).isoformat(),
-                "updated_at": datetime.now(timezone.utc).isoformat()
+                "created_at": now - timedelta(days=1),
+                "updated_at": now
             },
             {
-                "id": str(uuid.uuid4()),
+                "id": new_id(),
                 "order_number": "D-1-13012026-1",
                 "customer_email": "customer4@example.com",
                 "customer_name": "Sneha Reddy",
@@ -752,13 +1196,13 @@ async def create_sample_data():
                     "status": "shipped",
                     "is_shipmozo_booked": True,
                     "shipmozo_order_id": "SM123456",
-                    "booked_at": (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+                    "booked_at": now - timedelta(days=1)
                 },
-                "created_at": (datetime.now(timezone.utc) - timedelta(days=2)).isoformat(),
-                "updated_at": datetime.now(timezone.utc).isoformat()
+                "created_at": now - timedelta(days=2),
+                "updated_at": now
             },
             {
-                "id": str(uuid.uuid4()),
+                "id": new_id(),
                 "order_number": "D-1-10012026-1",
                 "customer_email": "customer5@example.com",
                 "customer_name": "Vikram Singh",
@@ -803,12 +1247,31 @@ async def create_sample_data():
                     "status": "delivered",
                     "is_shipmozo_booked": True,
                     "shipmozo_order_id": "SM789012",
-                    "booked_at": (datetime.now(timezone.utc) - timedelta(days=4)).isoformat()
+                    "booked_at": now - timedelta(days=4)
                 },
-                "created_at": (datetime.now(timezone.utc) - timedelta(days=5)).isoformat(),
-                "updated_at": datetime.now(timezone.utc).isoformat()
+                "created_at": now - timedelta(days=5),
+                "updated_at": now
             }
         ]
         
-        await db.orders.insert_many(sample_orders)
+        # ordered=False so a duplicate from a racing worker doesn't abort
+        # the rest of the batch (order_number is unique-indexed)
+        await db.orders.insert_many(sample_orders, ordered=False)
         logger.info(f"Created {len(sample_orders)} sample orders for testing (schema synced with DRIBBLE-NEW-2026)")
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop + httptools cut event-loop and HTTP-parsing overhead versus the
+    # stdlib asyncio loop and h11 parser; "auto" falls back cleanly where
+    # either isn't installed. Access logging is off — it serializes a line
+    # per request on the hot path.
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", 8001)),
+        loop="auto",
+        http="auto",
+        access_log=False,
+    )
@@ -0,0 +1,55 @@
+"""
+Shared fixtures for the pytest port of the DRIBBLE API test suite.
+
+Session-scoped fixtures hold the pooled HTTP session, the admin token and
+the orders list, so logging in and fetching orders happen once per worker
+instead of once per test. Run with `pytest -n auto --dist=loadfile` when
+pytest-xdist is installed to spread independent tests across processes.
+"""
+
+import pytest
+import requests
+
+from backend_test import (
+    ADMIN_EMAIL,
+    ADMIN_PASSWORD,
+    BACKEND_URL,
+    URL_LOGIN,
+    URL_ORDERS,
+)
+
+
+@pytest.fixture(scope="session")
+def session():
+    """One keep-alive session per worker; skips everything if the backend is down"""
+    s = requests.Session()
+    s.headers["Content-Type"] = "application/json"
+    try:
+        s.head(BACKEND_URL, timeout=5, allow_redirects=False)
+    except requests.RequestException:
+        pytest.skip(f"backend unreachable at {BACKEND_URL}")
+    yield s
+    s.close()
+
+
+@pytest.fixture(scope="session")
+def auth(session):
+    """Log in once per worker and attach the bearer token to the session"""
+    response = session.post(
+        URL_LOGIN,
+        json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD},
+        timeout=10
+    )
+    if response.status_code != 200:
+        pytest.skip(f"admin login failed: HTTP {response.status_code}")
+    token = response.json()["access_token"]
+    session.headers["Authorization"] = f"Bearer {token}"
+    return token
+
+
+@pytest.fixture(scope="session")
+def orders(session, auth):
+    """Orders list fetched once per worker and shared by dependent tests"""
+    response = session.get(URL_ORDERS, timeout=10)
+    response.raise_for_status()
+    return response.json()
@@ -0,0 +1,120 @@
+"""
+Pytest port of backend_test.py: each check is a standalone test function
+over the session-scoped fixtures in conftest.py, so the suite can run
+under pytest-xdist with independent tests in parallel workers.
+"""
+
+import pytest
+
+from backend_test import (
+    ADMIN_EMAIL,
+    NEW_ORDER_FIELDS,
+    VALID_PENDING_STATUSES,
+    URL_HEALTH,
+    URL_ME,
+    URL_ORDER_CANCEL,
+    URL_ORDER_DETAIL,
+    URL_ORDER_STATS,
+    URL_ORDERS_PENDING,
+    URL_ORDER_STATUS,
+    URL_PUSH_TOKENS,
+)
+
+
+def test_health_check(session):
+    response = session.get(URL_HEALTH, timeout=10)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "healthy"
+    assert data["version"] == "2.0.0"
+
+
+def test_admin_login(auth):
+    # The fixture already performed the login; a token proves it succeeded
+    assert auth
+
+
+def test_get_current_user(session, auth):
+    response = session.get(URL_ME, timeout=10)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["email"] == ADMIN_EMAIL
+    assert data["role"] == "admin"
+    assert "name" in data
+
+
+def test_get_orders(orders):
+    assert isinstance(orders, list)
+    if orders:
+        assert NEW_ORDER_FIELDS & orders[0].keys()
+
+
+def test_get_orders_with_status_filter(session, auth):
+    response = session.get(URL_ORDERS_PENDING, timeout=10)
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data, list)
+    bad_order = next((o for o in data if o.get("status") not in VALID_PENDING_STATUSES), None)
+    assert bad_order is None, f"order {bad_order and bad_order.get('id')} leaked through the pending filter"
+
+
+def test_get_single_order(session, auth, orders):
+    if not orders:
+        pytest.skip("no orders available to test with")
+    order_id = orders[0]["id"]
+    response = session.get(URL_ORDER_DETAIL(order_id), timeout=10)
+    assert response.status_code == 200
+    assert response.json()["id"] == order_id
+
+
+def test_update_order_status_put(session, auth, orders):
+    if not orders:
+        pytest.skip("no orders available to test with")
+    test_order = next((o for o in orders if o.get("status") != "confirmed"), orders[0])
+    response = session.put(
+        URL_ORDER_STATUS(test_order["id"]),
+        json={"status": "confirmed"},
+        timeout=10
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "confirmed"
+
+
+def test_cancel_order(session, auth, orders):
+    cancellable = next(
+        (o for o in orders if o.get("status") not in ("cancelled", "delivered")),
+        None
+    )
+    if cancellable is None:
+        pytest.skip("no suitable order found to cancel")
+    response = session.post(
+        URL_ORDER_CANCEL(cancellable["id"]),
+        json={"reason": "Test cancellation"},
+        timeout=10
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"]
+    assert data["order"]["status"] == "cancelled"
+
+
+def test_get_order_stats(session, auth):
+    response = session.get(URL_ORDER_STATS, timeout=10)
+    assert response.status_code == 200
+    data = response.json()
+    for field in ("total_orders", "pending_orders", "today_orders",
+                  "paid_orders", "shipped_orders", "delivered_orders", "cancelled_orders"):
+        assert field in data
+
+
+def test_register_push_token(session, auth):
+    response = session.post(
+        URL_PUSH_TOKENS,
+        json={
+            "push_token": "test_token_12345",
+            "device_info": {"brand": "TestDevice", "model": "TestModel", "os": "TestOS"}
+        },
+        timeout=10
+    )
+    assert response.status_code == 200
+    assert "successfully" in response.json()["message"].lower()